@@ -4,14 +4,43 @@ Netflix Movie Recommendation Bot - Command Line Interface
 """
 
 import os
+import atexit
 from recommendation_engine import NetflixRecommendationBot
 from data_downloader import download_netflix_dataset
 
+try:
+    import readline
+except ImportError:
+    # readline is not available on Windows (pyreadline3 provides it there)
+    readline = None
+
+HISTORY_FILE = os.path.expanduser("~/.netflix_bot_history")
+
 class NetflixBotCLI:
     def __init__(self):
         self.bot = None
+        self.setup_history()
         self.setup_bot()
     
+    def setup_history(self):
+        """Enable input history that persists between sessions"""
+        if readline is None:
+            return
+        
+        readline.set_history_length(1000)
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+        atexit.register(self.save_history)
+    
+    def save_history(self):
+        """Write the input history to disk"""
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+    
     def setup_bot(self):
         """Setup the recommendation bot"""
         print("🎬 Netflix Movie Recommendation Bot")
@@ -20,8 +49,8 @@ class NetflixBotCLI:
         # Check if dataset exists
         if not os.path.exists("netflix_titles.csv"):
             print("Dataset not found locally. Downloading...")
-            df, local_path = download_netflix_dataset()
-            if df is None:
+            _, local_path = download_netflix_dataset()
+            if local_path is None:
                 print("❌ Failed to download dataset. Please check your internet connection.")
                 return
         
@@ -49,11 +78,13 @@ class NetflixBotCLI:
             print("No recommendations found.")
             return
         
-        for idx, (_, row) in enumerate(recommendations.iterrows(), 1):
-            print(f"\n{idx}. {row['title']} ({row['type']}, {row['release_year']})")
-            print(f"   Rating: {row['rating']}")
-            print(f"   Genres: {row['listed_in']}")
-            description = str(row['description'])[:150] + "..." if len(str(row['description'])) > 150 else str(row['description'])
+        for idx, row in enumerate(recommendations.itertuples(index=False), 1):
+            print(f"\n{idx}. {row.title} ({row.type}, {row.release_year})")
+            print(f"   Rating: {row.rating}")
+            print(f"   Genres: {row.listed_in}")
+            description = str(row.description)
+            if len(description) > 150:
+                description = description[:150] + "..."
             print(f"   Description: {description}")
     
     def content_based_recommendations(self):
@@ -1,9 +1,9 @@
 import kagglehub
-import pandas as pd
 import os
+import shutil
 
 def download_netflix_dataset():
-    """Download the Netflix dataset from Kaggle"""
+    """Download the Netflix dataset from Kaggle and save a local copy of the CSV"""
     try:
         # Download latest version
         path = kagglehub.dataset_download("shivamb/netflix-shows")
@@ -21,18 +21,13 @@ def download_netflix_dataset():
                 break
         
         if csv_file:
-            df = pd.read_csv(csv_file)
-            print(f"\nDataset shape: {df.shape}")
-            print(f"\nColumns: {df.columns.tolist()}")
-            print(f"\nFirst few rows:")
-            print(df.head())
-            
-            # Save a local copy for easy access
+            # Save a local copy for easy access; the file is copied as-is
+            # rather than parsed, so no DataFrame is returned
             local_path = "netflix_titles.csv"
-            df.to_csv(local_path, index=False)
+            shutil.copyfile(csv_file, local_path)
             print(f"\nDataset saved locally as: {local_path}")
             
-            return df, local_path
+            return None, local_path
         else:
             print("No CSV file found in the downloaded dataset")
             return None, None
@@ -1,46 +1,69 @@
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.preprocessing import StandardScaler
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.preprocessing import StandardScaler, normalize
+from scipy.sparse import hstack
+import os
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
+import functools
+import importlib.util
+import joblib
 import warnings
 warnings.filterwarnings('ignore')
 
+# Word pattern used by the search index
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+def _split_genres(genres):
+    """Split a comma-separated genre list into lowercase genre names"""
+    return [genre.strip().lower() for genre in genres.split(',') if genre.strip()]
+
+# Bump whenever the layout of the cached feature matrix changes
+_FEATURE_CACHE_VERSION = 1
+
+# Use the multithreaded pyarrow CSV parser when it is installed
+_CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+
 class NetflixRecommendationBot:
-    def __init__(self, csv_path='netflix_titles.csv'):
+    # Text fields vectorized for content similarity and their relative weights
+    FEATURE_WEIGHTS = {
+        'listed_in': 1.0,
+        'description': 1.0,
+        'cast': 1.0,
+        'director': 1.0
+    }
+    
+    # Column dtypes passed to read_csv so they are not inferred
+    # (release_year is read as text and coerced to numbers in preprocess_data,
+    # so missing or malformed years become NaN)
+    CSV_DTYPES = {
+        'release_year': 'str',
+        'type': 'category',
+        'rating': 'category'
+    }
+    
+    def __init__(self, csv_path='netflix_titles.csv', cache_path=None):
         """Initialize the recommendation bot with Netflix data"""
+        self.csv_path = csv_path
+        self.cache_path = cache_path or os.path.splitext(csv_path)[0] + '_features.joblib'
         self.df = None
         self.tfidf_matrix = None
         self.feature_matrix = None
-        self.vectorizer = None
+        self.vectorizers = {}
         self.scaler = StandardScaler()
         
-        # Download NLTK data
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('wordnet', quiet=True)
-        except:
-            pass
-        
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
-        
         # Load and preprocess data
         self.load_data(csv_path)
         if self.df is not None:
             self.preprocess_data()
-            self.create_feature_matrix()
+            if not self.load_feature_cache():
+                self.create_feature_matrix()
+                self.save_feature_cache()
     
     def load_data(self, csv_path):
         """Load the Netflix dataset"""
         try:
-            self.df = pd.read_csv(csv_path)
+            self.df = pd.read_csv(csv_path, engine=_CSV_ENGINE, dtype=self.CSV_DTYPES)
             print(f"Loaded {len(self.df)} titles from Netflix dataset")
             print(f"Columns: {self.df.columns.tolist()}")
         except FileNotFoundError:
@@ -48,26 +71,6 @@ class NetflixRecommendationBot:
         except Exception as e:
             print(f"Error loading data: {e}")
     
-    def clean_text(self, text):
-        """Clean and preprocess text data"""
-        if pd.isna(text):
-            return ""
-        
-        # Convert to lowercase
-        text = str(text).lower()
-        
-        # Remove special characters and numbers
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        
-        # Tokenize
-        tokens = word_tokenize(text)
-        
-        # Remove stopwords and lemmatize
-        tokens = [self.lemmatizer.lemmatize(token) for token in tokens 
-                 if token not in self.stop_words and len(token) > 2]
-        
-        return ' '.join(tokens)
-    
     def preprocess_data(self):
         """Preprocess the Netflix data"""
         # Fill missing values
@@ -77,61 +80,247 @@ class NetflixRecommendationBot:
         self.df['listed_in'] = self.df['listed_in'].fillna('')
         self.df['country'] = self.df['country'].fillna('')
         
-        # Create combined text features
-        self.df['genres_clean'] = self.df['listed_in'].apply(self.clean_text)
-        self.df['description_clean'] = self.df['description'].apply(self.clean_text)
-        self.df['cast_clean'] = self.df['cast'].apply(self.clean_text)
-        self.df['director_clean'] = self.df['director'].apply(self.clean_text)
-        
-        # Combine all text features
-        self.df['combined_features'] = (
-            self.df['genres_clean'] + ' ' +
-            self.df['description_clean'] + ' ' +
-            self.df['cast_clean'] + ' ' +
-            self.df['director_clean']
-        )
+        # Store type and rating as categoricals so equality filters compare
+        # small integer codes instead of strings
+        self.df['type'] = self.df['type'].astype('category')
+        self.df['rating'] = self.df['rating'].astype('category')
         
         # Extract release year
         if 'release_year' in self.df.columns:
             self.df['release_year'] = pd.to_numeric(self.df['release_year'], errors='coerce')
         
+        self.build_type_index()
+        self.build_genre_index()
+        self.build_search_index()
+        self.build_stats()
+        
         print("Data preprocessing completed!")
     
+    def build_type_index(self):
+        """Precompute row positions per content type, newest releases first"""
+        type_codes = self.df['type'].cat.codes.to_numpy()
+        categories = list(self.df['type'].cat.categories)
+        
+        def rows_of_type(value):
+            if value not in categories:
+                return np.empty(0, dtype=np.intp)
+            return np.flatnonzero(type_codes == categories.index(value))
+        
+        self._type_idx = {
+            'movie': rows_of_type('Movie'),
+            'tv show': rows_of_type('TV Show'),
+            'all': np.arange(len(self.df))
+        }
+        
+        # Row positions sorted by release year (most recent first, missing years last)
+        if 'release_year' in self.df.columns:
+            years = self.df['release_year'].to_numpy(dtype=float, na_value=np.nan)
+            year_order = np.argsort(-years, kind='stable')
+        else:
+            year_order = np.arange(len(self.df))
+        self._year_order_by_type = {
+            key: year_order[np.isin(year_order, rows)]
+            for key, rows in self._type_idx.items()
+        }
+    
+    def build_genre_index(self):
+        """Build a sparse title x genre membership matrix"""
+        vectorizer = CountVectorizer(
+            tokenizer=_split_genres,
+            token_pattern=None,
+            lowercase=False,
+            binary=True
+        )
+        # Column-major, since genre queries select whole genre columns
+        self._genre_matrix = vectorizer.fit_transform(self.df['listed_in']).tocsc()
+        self._genre_vocab = vectorizer.vocabulary_
+    
+    def _genre_mask(self, genre):
+        """Boolean mask of the titles listed under a genre query"""
+        # Every comma-separated part of the query must match (e.g. 'Action,
+        # Comedies'); a part matches all genres whose name contains it, so
+        # 'Action' also matches 'Action & Adventure'. An empty query matches
+        # every title, as a substring match on '' would
+        parts = _split_genres(genre)
+        mask = np.ones(len(self.df), dtype=bool)
+        for part in parts:
+            columns = [column for name, column in self._genre_vocab.items() if part in name]
+            mask &= np.asarray(self._genre_matrix[:, columns].sum(axis=1)).ravel() > 0
+        return mask
+    
+    def build_stats(self):
+        """Compute the dataset statistics returned by get_stats"""
+        genres = self.df['listed_in'].str.split(',').explode().str.strip()
+        year_min, year_max = self.df['release_year'].agg(['min', 'max'])
+        self._stats = {
+            'total_titles': len(self.df),
+            'movies': len(self._type_idx['movie']),
+            'tv_shows': len(self._type_idx['tv show']),
+            'unique_genres': genres.nunique(),
+            'release_year_range': f"{year_min:.0f} - {year_max:.0f}"
+        }
+    
+    def _rows_for_type(self, content_type):
+        """Row positions for a content type ('movie', 'tv show' or anything else for all)"""
+        return self._type_idx.get(content_type.lower(), self._type_idx['all'])
+    
+    def build_search_index(self):
+        """Build the title lookup tables and the inverted token index used for search"""
+        # Lowercase titles for exact and substring title lookups; the first
+        # occurrence wins for duplicate titles
+        self._title_lower = self.df['title'].fillna('').str.lower().to_numpy(dtype=str)
+        self._title_exact = {}
+        for pos, title in enumerate(self._title_lower):
+            self._title_exact.setdefault(title, pos)
+        
+        # Inverted token -> row position index for search_titles
+        self._token_index = {}
+        fields = zip(
+            self.df['title'].fillna(''),
+            self.df['description'],
+            self.df['cast'],
+            self.df['director']
+        )
+        for pos, row in enumerate(fields):
+            for token in _WORD_RE.findall(' '.join(row).lower()):
+                self._token_index.setdefault(token, set()).add(pos)
+    
     def create_feature_matrix(self):
         """Create TF-IDF feature matrix"""
-        # Create TF-IDF matrix
-        self.vectorizer = TfidfVectorizer(
-            max_features=5000,
-            stop_words='english',
-            ngram_range=(1, 2)
-        )
-        
-        self.tfidf_matrix = self.vectorizer.fit_transform(self.df['combined_features'])
+        # Vectorize each text field separately; TfidfVectorizer handles
+        # tokenization, lowercasing and stopword removal. A field without any
+        # usable terms (e.g. an all-empty director column) is left out, and
+        # only the fitted vectorizers are kept so queries line up with the
+        # matrix columns
+        self.vectorizers = {}
+        blocks = []
+        for field, weight in self.FEATURE_WEIGHTS.items():
+            vectorizer = TfidfVectorizer(
+                max_features=5000,
+                stop_words='english',
+                ngram_range=(1, 2),
+                lowercase=True,
+                token_pattern=r'(?u)\b[a-zA-Z]{3,}\b',
+                dtype=np.float32
+            )
+            try:
+                block = vectorizer.fit_transform(self.df[field])
+            except ValueError:
+                print(f"Skipping '{field}': no usable terms")
+                continue
+            blocks.append(block * weight)
+            self.vectorizers[field] = vectorizer
+        
+        if not blocks:
+            raise ValueError("No text field has any usable terms")
+        
+        # Stack the weighted fields side by side and L2-normalize the rows, so
+        # cosine similarity against this matrix is a plain sparse dot product.
+        # float32 halves the memory traffic of every similarity query.
+        self.tfidf_matrix = hstack(blocks, format='csr').astype(np.float32, copy=False)
+        self.tfidf_matrix = normalize(self.tfidf_matrix, norm='l2', copy=False)
+        
+        self.index_feature_matrix()
         print(f"Created TF-IDF matrix with shape: {self.tfidf_matrix.shape}")
     
-    def get_content_recommendations(self, title, n_recommendations=10):
-        """Get content-based recommendations"""
-        # Find the movie/show
-        idx = self.df[self.df['title'].str.contains(title, case=False, na=False)].index
-        
-        if len(idx) == 0:
-            return f"Title '{title}' not found in the dataset."
+    def index_feature_matrix(self):
+        """Prepare the fitted feature matrix for queries"""
+        # Column-major copy so a query only touches the postings of its own terms
+        self._tfidf_csc = self.tfidf_matrix.tocsc()
+        
+        # Per-instance query cache, rebuilt because vectors cached for the
+        # previous vectorizers are no longer valid
+        self._vectorize_query = functools.lru_cache(maxsize=512)(self._transform_query)
+    
+    def _feature_cache_key(self, fields):
+        """Settings the cached feature matrix must have been built with"""
+        return {
+            'version': _FEATURE_CACHE_VERSION,
+            'weights': self.FEATURE_WEIGHTS,
+            'rows': len(self.df),
+            'fields': list(fields)
+        }
+    
+    def load_feature_cache(self):
+        """Load the fitted vectorizers and TF-IDF matrix if the cache is up to date"""
+        try:
+            if os.path.getmtime(self.cache_path) < os.path.getmtime(self.csv_path):
+                return False
+            cache = joblib.load(self.cache_path)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Error loading feature cache: {e}")
+            return False
         
-        # Use the first match
-        idx = idx[0]
+        if cache.get('key') != self._feature_cache_key(cache.get('vectorizers', {})):
+            return False
         
-        # Calculate cosine similarity
-        cosine_sim = cosine_similarity(self.tfidf_matrix[idx], self.tfidf_matrix).flatten()
+        self.vectorizers = cache['vectorizers']
+        self.tfidf_matrix = cache['tfidf_matrix']
+        self.index_feature_matrix()
+        print(f"Loaded TF-IDF matrix with shape: {self.tfidf_matrix.shape} from {self.cache_path}")
+        return True
+    
+    def save_feature_cache(self):
+        """Save the fitted vectorizers and TF-IDF matrix for the next start"""
+        try:
+            joblib.dump({
+                'key': self._feature_cache_key(self.vectorizers),
+                'vectorizers': self.vectorizers,
+                'tfidf_matrix': self.tfidf_matrix
+            }, self.cache_path)
+        except Exception as e:
+            print(f"Error saving feature cache: {e}")
+    
+    def _transform_query(self, text):
+        """Transform and L2-normalize a query with the corpus analyzers"""
+        blocks = [vectorizer.transform([text]) for vectorizer in self.vectorizers.values()]
+        return normalize(hstack(blocks, format='csr'), norm='l2', copy=False)
+    
+    def _top_k(self, query_vector, content_type, k, exclude=None):
+        """Return the row positions and scores of the k titles most similar to a query vector"""
+        rows = self._rows_for_type(content_type)
+        
+        # Cosine similarity is a sparse dot product (rows are already
+        # L2-normalized); gathering only the query's nonzero columns scores
+        # every title while skipping all terms the query does not contain
+        query_vector = query_vector.tocsr()
+        sims = self._tfidf_csc[:, query_vector.indices] @ query_vector.data
+        if len(rows) != len(sims):
+            sims = sims[rows]
+        
+        if exclude is not None:
+            excluded = np.flatnonzero(rows == exclude)
+            sims[excluded] = -np.inf
+            k = min(k, sims.size - len(excluded))
+        
+        # Select the top k without sorting the whole pool
+        k = min(k, sims.size)
+        if k <= 0:
+            return rows[:0], sims[:0]
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top], kind='stable')]
+        return rows[top], sims[top]
+    
+    def get_content_recommendations(self, title, n_recommendations=10):
+        """Get content-based recommendations"""
+        # Find the movie/show, preferring an exact title match
+        title_lower = title.lower()
+        idx = self._title_exact.get(title_lower)
         
-        # Get similarity scores
-        sim_scores = list(enumerate(cosine_sim))
-        sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
+        if idx is None:
+            # Use the first title containing the query
+            matches = np.flatnonzero(np.char.find(self._title_lower, title_lower) >= 0)
+            if len(matches) == 0:
+                return f"Title '{title}' not found in the dataset."
+            idx = matches[0]
         
-        # Get top recommendations (excluding the input title)
-        sim_scores = sim_scores[1:n_recommendations+1]
+        # Rank every other title by similarity to the input title
+        movie_indices, _ = self._top_k(self.tfidf_matrix[idx], 'all', n_recommendations, exclude=idx)
         
-        # Get movie indices
-        movie_indices = [i[0] for i in sim_scores]
+        if len(movie_indices) == 0:
+            return f"No recommendations found for '{title}'."
         
         # Return recommendations
         recommendations = self.df.iloc[movie_indices][['title', 'type', 'release_year', 'rating', 'listed_in', 'description']]
@@ -140,56 +329,46 @@ class NetflixRecommendationBot:
     
     def get_recommendations_by_genre(self, genre, content_type='all', n_recommendations=10):
         """Get recommendations by genre"""
-        # Filter by content type
-        if content_type.lower() == 'movie':
-            filtered_df = self.df[self.df['type'] == 'Movie']
-        elif content_type.lower() == 'tv show':
-            filtered_df = self.df[self.df['type'] == 'TV Show']
-        else:
-            filtered_df = self.df
+        # Titles of the content type, most recent releases first
+        rows = self._year_order_by_type.get(content_type.lower(), self._year_order_by_type['all'])
         
         # Filter by genre
-        genre_mask = filtered_df['listed_in'].str.contains(genre, case=False, na=False)
-        genre_titles = filtered_df[genre_mask]
+        rows = rows[self._genre_mask(genre)[rows]]
         
-        if len(genre_titles) == 0:
+        if len(rows) == 0:
             return f"No {content_type} found for genre '{genre}'"
         
-        # Sort by release year (most recent first)
-        if 'release_year' in genre_titles.columns:
-            genre_titles = genre_titles.sort_values('release_year', ascending=False)
+        genre_titles = self.df.iloc[rows[:n_recommendations]]
         
-        return genre_titles.head(n_recommendations)[['title', 'type', 'release_year', 'rating', 'listed_in', 'description']]
+        return genre_titles[['title', 'type', 'release_year', 'rating', 'listed_in', 'description']]
     
     def get_popular_titles(self, content_type='all', n_recommendations=10):
         """Get popular titles (most recent releases)"""
-        # Filter by content type
-        if content_type.lower() == 'movie':
-            filtered_df = self.df[self.df['type'] == 'Movie']
-        elif content_type.lower() == 'tv show':
-            filtered_df = self.df[self.df['type'] == 'TV Show']
-        else:
-            filtered_df = self.df
+        # Take the head of the precomputed release-year order for the content type
+        order = self._year_order_by_type.get(content_type.lower(), self._year_order_by_type['all'])
+        popular_titles = self.df.iloc[order[:n_recommendations]]
         
-        # Sort by release year
-        if 'release_year' in filtered_df.columns:
-            popular_titles = filtered_df.sort_values('release_year', ascending=False)
-        else:
-            popular_titles = filtered_df
-        
-        return popular_titles.head(n_recommendations)[['title', 'type', 'release_year', 'rating', 'listed_in', 'description']]
+        return popular_titles[['title', 'type', 'release_year', 'rating', 'listed_in', 'description']]
     
     def search_titles(self, query, n_results=10):
         """Search for titles containing the query"""
-        # Search in title, description, cast, and director
-        mask = (
-            self.df['title'].str.contains(query, case=False, na=False) |
-            self.df['description'].str.contains(query, case=False, na=False) |
-            self.df['cast'].str.contains(query, case=False, na=False) |
-            self.df['director'].str.contains(query, case=False, na=False)
-        )
-        
-        results = self.df[mask]
+        # Look up every query word in the search index
+        tokens = _WORD_RE.findall(query.lower())
+        matches = set()
+        if tokens:
+            matches = set.intersection(*(self._token_index.get(token, set()) for token in tokens))
+        
+        if matches:
+            results = self.df.iloc[sorted(matches)]
+        else:
+            # Fall back to a substring scan in title, description, cast, and director
+            mask = (
+                self.df['title'].str.contains(query, case=False, na=False) |
+                self.df['description'].str.contains(query, case=False, na=False) |
+                self.df['cast'].str.contains(query, case=False, na=False) |
+                self.df['director'].str.contains(query, case=False, na=False)
+            )
+            results = self.df[mask]
         
         if len(results) == 0:
             return f"No results found for '{query}'"
@@ -197,51 +376,24 @@ class NetflixRecommendationBot:
         return results.head(n_results)[['title', 'type', 'release_year', 'rating', 'listed_in', 'description']]
     
     def get_stats(self):
-        """Get dataset statistics"""
-        stats = {
-            'total_titles': len(self.df),
-            'movies': len(self.df[self.df['type'] == 'Movie']),
-            'tv_shows': len(self.df[self.df['type'] == 'TV Show']),
-            'unique_genres': len(set([genre.strip() for genres in self.df['listed_in'].dropna() 
-                                    for genre in genres.split(',')])),
-            'release_year_range': f"{self.df['release_year'].min():.0f} - {self.df['release_year'].max():.0f}"
-        }
-        return stats
+        """Get dataset statistics (computed once during preprocessing)"""
+        return dict(self._stats)
     
     def get_recommendations_by_description(self, description, content_type='all', n_recommendations=10):
         """Get recommendations based on user description using TF-IDF similarity"""
         # Filter by content type
-        if content_type.lower() == 'movie':
-            filtered_df = self.df[self.df['type'] == 'Movie']
-        elif content_type.lower() == 'tv show':
-            filtered_df = self.df[self.df['type'] == 'TV Show']
-        else:
-            filtered_df = self.df
-        
-        if len(filtered_df) == 0:
+        if len(self._rows_for_type(content_type)) == 0:
             return f"No {content_type} found"
         
-        # Clean the input description
-        clean_description = self.clean_text(description)
-        
-        # Create TF-IDF matrix for filtered data
-        filtered_indices = filtered_df.index
-        filtered_tfidf = self.tfidf_matrix[filtered_indices]
-        
-        # Transform the input description
-        description_vector = self.vectorizer.transform([clean_description])
-        
-        # Calculate cosine similarity
-        cosine_sim = cosine_similarity(description_vector, filtered_tfidf).flatten()
-        
-        # Get similarity scores
-        sim_scores = list(enumerate(cosine_sim))
-        sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
+        # Transform and L2-normalize the input description with the same
+        # analyzers that were used for the corpus
+        description_vector = self._vectorize_query(description)
         
-        # Get top recommendations
-        top_indices = [filtered_indices[i] for i, score in sim_scores[:n_recommendations] if score > 0]
+        # Rank the titles of that type, keeping only actual matches
+        top_indices, scores = self._top_k(description_vector, content_type, n_recommendations)
+        top_indices = top_indices[scores > 0]
         
-        if not top_indices:
+        if len(top_indices) == 0:
             return f"No matches found for description: '{description}'"
         
         # Return recommendations
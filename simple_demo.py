@@ -4,29 +4,245 @@ This version works with basic Python libraries for testing purposes.
 """
 
 import csv
+import os
 import re
+import bisect
+import functools
+import hashlib
+import heapq
+import pickle
+from array import array
 from collections import Counter
+from collections.abc import Sequence
 import json
 
+# Word pattern used to build and query the search index
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Separator between titles in the substring search blob
+_BLOB_SEP = '\x1f'
+
+# CSV columns kept in memory for each title
+_FIELDS = ('title', 'type', 'release_year', 'rating', 'listed_in', 'description', 'cast', 'director')
+
+# Bump whenever the layout of the pickled index changes
+_CACHE_VERSION = 7
+
+# Attributes built by build_index that are stored in the pickle cache
+_INDEX_ATTRS = (
+    '_inv_index', '_genre_id', '_genre_mask', '_title_to_idx',
+    '_type_id', '_type_names', '_type_codes', '_rating_id',
+    '_titles', '_years', '_genres', '_desc_trunc',
+    '_title_lc', '_blob', '_starts'
+)
+
+def _popcount(mask):
+    """Count the set bits of a genre bitmask"""
+    return bin(mask).count('1')
+
+if hasattr(int, 'bit_count'):
+    # Python 3.10+ counts bits natively
+    _popcount = int.bit_count
+
+def _score_kernel(genre_mask, type_id, rating_id, anchor_mask, anchor_type, anchor_rating):
+    """Score every title against an anchor's genre mask, type id and rating id, in half points"""
+    return array('i', (
+        _popcount(mask & anchor_mask) * 4 + (type_code == anchor_type) * 2 + (rating_code == anchor_rating)
+        for mask, type_code, rating_code in zip(genre_mask, type_id, rating_id)
+    ))
+
+def _from_half_points(half_points):
+    """Convert a half-point score back to the int or float similarity score"""
+    return half_points / 2 if half_points % 2 else half_points // 2
+
+class _MovieRows(Sequence):
+    """Read-only sequence of movie dicts built on demand from the column lists"""
+    def __init__(self, columns):
+        self._columns = columns
+    
+    def __len__(self):
+        return len(self._columns['title'])
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {field: column[index] for field, column in self._columns.items()}
+
 class SimpleNetflixBot:
     def __init__(self, csv_file='netflix_titles.csv'):
-        self.movies = []
-        self.load_data(csv_file)
+        self._columns = {field: [] for field in _FIELDS}
+        self.cache_file = os.path.splitext(csv_file)[0] + '.cache.pkl'
+        self._csv_sha1 = None
+        if not self.load_cache(csv_file):
+            self.load_data(csv_file)
+            self.build_index()
+            self.save_cache()
+        self.build_stats()
+        
+        # Per-instance cache of genre/type filter results
+        self._filter_ids = functools.lru_cache(maxsize=128)(self._match_genre_type)
+    
+    @property
+    def movies(self):
+        """Titles as a sequence of dicts, kept for compatibility with row access"""
+        return _MovieRows(self._columns)
+    
+    def build_index(self):
+        """Build an inverted index mapping each word to the movies containing it"""
+        # Lowercase the searched fields once so queries never call .lower()
+        # on corpus text. The joined searchable text of each title is built
+        # here only, feeds both the word index and the substring blob, and
+        # is kept afterwards only inside the blob
+        columns = self._columns
+        self._title_lc = [title.lower() for title in columns['title']]
+        searchable_lc = [
+            ' '.join(fields).lower()
+            for fields in zip(
+                columns['title'],
+                columns['description'],
+                columns['cast'],
+                columns['director'],
+                columns['listed_in']
+            )
+        ]
+        
+        self._inv_index = {}
+        for i, searchable_text in enumerate(searchable_lc):
+            for token in _TOKEN_RE.findall(searchable_text):
+                self._inv_index.setdefault(token, set()).add(i)
+        
+        # All searchable texts joined into one string with the offset where
+        # each title starts, so substring search is a single str.find scan
+        self._blob = _BLOB_SEP.join(searchable_lc)
+        self._starts = []
+        offset = 0
+        for searchable_text in searchable_lc:
+            self._starts.append(offset)
+            offset += len(searchable_text) + len(_BLOB_SEP)
+        
+        # Intern every genre as a bit position and store each movie's genres
+        # as an integer bitmask
+        self._genre_id = {}
+        self._genre_mask = []
+        for genres in columns['listed_in']:
+            mask = 0
+            for genre in genres.split(','):
+                bit = self._genre_id.setdefault(genre.strip().lower(), len(self._genre_id))
+                mask |= 1 << bit
+            self._genre_mask.append(mask)
+        
+        # Lowercase title -> first movie index
+        self._title_to_idx = {}
+        for i, title_lc in enumerate(self._title_lc):
+            self._title_to_idx.setdefault(title_lc, i)
+        
+        # Type and rating interned as byte-sized codes for cheap equality
+        # checks, with a table to decode type codes for display and a
+        # lowercase type name -> code lookup for content-type filters
+        type_ids = {}
+        rating_ids = {}
+        self._type_id = array('B', (type_ids.setdefault(content_type, len(type_ids)) for content_type in columns['type']))
+        self._rating_id = array('B', (rating_ids.setdefault(rating, len(rating_ids)) for rating in columns['rating']))
+        self._type_names = list(type_ids)
+        self._type_codes = {}
+        for content_type, code in type_ids.items():
+            self._type_codes.setdefault(content_type.lower(), code)
+        
+        # Display fields, with the description already truncated, so results
+        # are assembled without building row dicts
+        self._titles = columns['title']
+        self._years = columns['release_year']
+        self._genres = columns['listed_in']
+        self._desc_trunc = [description[:100] + '...' for description in columns['description']]
+    
+    def build_stats(self):
+        """Compute the dataset statistics returned by get_stats"""
+        self._stats = {
+            'total_titles': len(self._type_id),
+            'movies': self._type_id.count(self._type_codes.get('movie')),
+            'tv_shows': self._type_id.count(self._type_codes.get('tv show')),
+            'unique_genres': len(self._genre_id)
+        }
+    
+    def _result_rows(self, indices):
+        """Build the result dict of each title at the given indices"""
+        return [
+            {
+                'title': self._titles[i],
+                'type': self._type_names[self._type_id[i]],
+                'year': self._years[i],
+                'genres': self._genres[i],
+                'description': self._desc_trunc[i]
+            }
+            for i in indices
+        ]
+    
+    def load_cache(self, csv_file):
+        """Load the parsed titles and index if the cache matches the CSV contents"""
+        try:
+            with open(csv_file, 'rb') as file:
+                self._csv_sha1 = hashlib.sha1(file.read()).hexdigest()
+            with open(self.cache_file, 'rb') as file:
+                cache = pickle.load(file)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f"Error loading cache: {e}")
+            return False
+        
+        if cache.get('version') != _CACHE_VERSION or cache.get('sha1') != self._csv_sha1:
+            return False
+        
+        self._columns = cache['columns']
+        for name in _INDEX_ATTRS:
+            setattr(self, name, cache[name])
+        print(f"Loaded {len(self._titles)} titles")
+        return True
+    
+    def save_cache(self):
+        """Save the parsed titles and index for the next start"""
+        # Sample data is not backed by a CSV file and is never cached
+        if self._csv_sha1 is None:
+            return
+        
+        cache = {'version': _CACHE_VERSION, 'sha1': self._csv_sha1, 'columns': self._columns}
+        for name in _INDEX_ATTRS:
+            cache[name] = getattr(self, name)
+        try:
+            with open(self.cache_file, 'wb') as file:
+                pickle.dump(cache, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Error saving cache: {e}")
     
     def load_data(self, csv_file):
         """Load Netflix data from CSV file"""
         try:
             with open(csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                self.movies = list(reader)
-            print(f"Loaded {len(self.movies)} titles")
+                reader = csv.reader(file)
+                header = next(reader)
+                
+                # Append the needed fields of each row straight into their
+                # columns instead of building a dict per row
+                positions = [header.index(field) for field in _FIELDS]
+                columns = [self._columns[field] for field in _FIELDS]
+                width = len(header)
+                for row in reader:
+                    # Skip blank lines as DictReader did, and treat fields
+                    # missing from a short row as empty
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row += [''] * (width - len(row))
+                    for column, position in zip(columns, positions):
+                        column.append(row[position])
+            print(f"Loaded {len(self._columns['title'])} titles")
         except FileNotFoundError:
             print(f"File {csv_file} not found. Creating sample data...")
             self.create_sample_data()
     
     def create_sample_data(self):
         """Create sample Netflix data for demonstration"""
-        self.movies = [
+        sample = [
             {
                 'title': 'Stranger Things',
                 'type': 'TV Show',
@@ -78,30 +294,29 @@ class SimpleNetflixBot:
                 'director': 'Various'
             }
         ]
-        print(f"Created {len(self.movies)} sample titles for demonstration")
+        self._columns = {field: [movie[field] for movie in sample] for field in _FIELDS}
+        print(f"Created {len(sample)} sample titles for demonstration")
     
     def simple_similarity(self, title1, title2):
         """Calculate simple similarity between two titles"""
-        movie1 = next((m for m in self.movies if m['title'].lower() == title1.lower()), None)
-        movie2 = next((m for m in self.movies if m['title'].lower() == title2.lower()), None)
+        i = self._title_to_idx.get(title1.lower())
+        j = self._title_to_idx.get(title2.lower())
         
-        if not movie1 or not movie2:
+        if i is None or j is None:
             return 0
         
         score = 0
         
         # Genre similarity
-        genres1 = set(genre.strip().lower() for genre in movie1['listed_in'].split(','))
-        genres2 = set(genre.strip().lower() for genre in movie2['listed_in'].split(','))
-        genre_overlap = len(genres1.intersection(genres2))
+        genre_overlap = _popcount(self._genre_mask[i] & self._genre_mask[j])
         score += genre_overlap * 2
         
         # Type similarity
-        if movie1['type'] == movie2['type']:
+        if self._type_id[i] == self._type_id[j]:
             score += 1
         
         # Rating similarity
-        if movie1['rating'] == movie2['rating']:
+        if self._rating_id[i] == self._rating_id[j]:
             score += 0.5
         
         return score
@@ -110,143 +325,136 @@ class SimpleNetflixBot:
         """Get recommendations based on a title"""
         title_lower = title.lower()
         
-        # Find the input movie
-        input_movie = None
-        for movie in self.movies:
-            if title_lower in movie['title'].lower():
-                input_movie = movie
-                break
+        # Find the input movie, preferring an exact title match
+        anchor = self._title_to_idx.get(title_lower)
+        if anchor is None:
+            for i, movie_title in enumerate(self._title_lc):
+                if title_lower in movie_title:
+                    anchor = i
+                    break
         
-        if not input_movie:
-            return f"Movie '{title}' not found. Available titles: {[m['title'] for m in self.movies[:5]]}"
+        if anchor is None:
+            return f"Movie '{title}' not found. Available titles: {self._titles[:5]}"
         
-        # Calculate similarities
-        similarities = []
-        for movie in self.movies:
-            if movie['title'] != input_movie['title']:
-                sim_score = self.simple_similarity(input_movie['title'], movie['title'])
-                similarities.append((movie, sim_score))
+        # Calculate similarities against the input movie's cached features
+        input_title = self._titles[anchor]
+        scores = _score_kernel(
+            self._genre_mask, self._type_id, self._rating_id,
+            self._genre_mask[anchor], self._type_id[anchor], self._rating_id[anchor]
+        )
         
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        # Exclude the input title, including any repeated rows of it (the
+        # anchor is always its first row)
+        i = anchor
+        while True:
+            scores[i] = -1
+            try:
+                i = self._titles.index(input_title, i + 1)
+            except ValueError:
+                break
+        
+        # Keep only the most similar titles
+        top = heapq.nlargest(num_recommendations, range(len(scores)), key=scores.__getitem__)
         
         # Return top recommendations
-        recommendations = []
-        for movie, score in similarities[:num_recommendations]:
-            recommendations.append({
-                'title': movie['title'],
-                'type': movie['type'],
-                'year': movie['release_year'],
-                'genres': movie['listed_in'],
-                'similarity_score': score
-            })
-        
-        return recommendations
+        return [
+            {
+                'title': self._titles[i],
+                'type': self._type_names[self._type_id[i]],
+                'year': self._years[i],
+                'genres': self._genres[i],
+                'similarity_score': _from_half_points(scores[i])
+            }
+            for i in top
+            if scores[i] >= 0
+        ]
     
     def get_by_genre(self, genre, content_type='all', num_results=5):
         """Get titles by genre"""
-        results = []
-        genre_lower = genre.lower()
-        
-        for movie in self.movies:
-            # Check genre match
-            movie_genres = [g.strip().lower() for g in movie['listed_in'].split(',')]
-            if genre_lower in movie_genres:
-                # Check content type
-                if content_type == 'all' or movie['type'].lower() == content_type.lower():
-                    results.append({
-                        'title': movie['title'],
-                        'type': movie['type'],
-                        'year': movie['release_year'],
-                        'genres': movie['listed_in'],
-                        'description': movie['description'][:100] + '...'
-                    })
-        
-        return results[:num_results]
+        genre_id = self._genre_id.get(genre.lower())
+        if genre_id is None:
+            return []
+        
+        type_code = None
+        if content_type != 'all':
+            type_code = self._type_codes.get(content_type.lower())
+            if type_code is None:
+                return []
+        
+        return self._result_rows(self._filter_ids(genre_id, type_code)[:num_results])
+    
+    def _match_genre_type(self, genre_id, type_code):
+        """Indices of the titles in a genre, limited to a type code unless it is None"""
+        genre_bit = 1 << genre_id
+        return tuple(
+            i for i, mask in enumerate(self._genre_mask)
+            if mask & genre_bit and (type_code is None or self._type_id[i] == type_code)
+        )
     
     def search(self, query, num_results=5):
         """Search for titles"""
-        results = []
         query_lower = query.lower()
         
-        for movie in self.movies:
-            # Search in multiple fields
-            searchable_text = ' '.join([
-                movie['title'],
-                movie['description'],
-                movie['cast'],
-                movie['director'],
-                movie['listed_in']
-            ]).lower()
+        # Look up every word of the query in the index
+        tokens = _TOKEN_RE.findall(query_lower)
+        hits = set()
+        if tokens:
+            hits = set.intersection(*(self._inv_index.get(token, set()) for token in tokens))
+        
+        if hits:
+            matches = sorted(hits)
+        else:
+            # Fall back to a substring scan for partial words
+            matches = self._substring_matches(query_lower, num_results)
+        
+        return self._result_rows(matches[:num_results])
+    
+    def _substring_matches(self, query_lower, num_results):
+        """Find the first titles whose searchable text contains a substring"""
+        matches = []
+        pos = 0
+        while len(matches) < num_results:
+            pos = self._blob.find(query_lower, pos)
+            if pos == -1:
+                break
+            i = bisect.bisect_right(self._starts, pos) - 1
+            matches.append(i)
             
-            if query_lower in searchable_text:
-                results.append({
-                    'title': movie['title'],
-                    'type': movie['type'],
-                    'year': movie['release_year'],
-                    'genres': movie['listed_in'],
-                    'description': movie['description'][:100] + '...'
-                })
-        
-        return results[:num_results]
+            # Continue from the next title so each title matches once
+            if i + 1 == len(self._starts):
+                break
+            pos = self._starts[i + 1]
+        
+        return matches
     
     def get_by_description(self, description, content_type='all', num_results=5):
         """Get titles by description using simple keyword matching"""
-        results = []
-        desc_words = set(description.lower().split())
+        # Count how many distinct query words each movie contains by walking
+        # the index postings of those words only
+        match_counts = Counter()
+        for word in set(_TOKEN_RE.findall(description.lower())):
+            for i in self._inv_index.get(word, ()):
+                match_counts[i] += 1
         
-        for movie in self.movies:
-            # Check content type
-            if content_type != 'all' and movie['type'].lower() != content_type.lower():
-                continue
-            
-            # Create searchable text
-            searchable_text = ' '.join([
-                movie['title'],
-                movie['description'],
-                movie['cast'],
-                movie['director'],
-                movie['listed_in']
-            ]).lower()
-            
-            # Count matching words
-            search_words = set(searchable_text.split())
-            matches = len(desc_words.intersection(search_words))
-            
-            if matches > 0:
-                results.append({
-                    'title': movie['title'],
-                    'type': movie['type'],
-                    'year': movie['release_year'],
-                    'genres': movie['listed_in'],
-                    'description': movie['description'][:100] + '...',
-                    'match_score': matches
-                })
-        
-        # Sort by match score
-        results.sort(key=lambda x: x['match_score'], reverse=True)
-        
-        return results[:num_results]
+        # Check content type
+        if content_type != 'all':
+            type_code = self._type_codes.get(content_type.lower())
+            for i in list(match_counts):
+                if self._type_id[i] != type_code:
+                    del match_counts[i]
+        
+        # Keep the best match scores (ties keep dataset order)
+        selected = heapq.nsmallest(num_results, match_counts.items(), key=lambda x: (-x[1], x[0]))
+        
+        results = self._result_rows([i for i, _ in selected])
+        for result, (_, matches) in zip(results, selected):
+            result['match_score'] = matches
+        
+        return results
     
     def get_stats(self):
-        """Get basic statistics"""
-        total = len(self.movies)
-        movies = len([m for m in self.movies if m['type'] == 'Movie'])
-        tv_shows = len([m for m in self.movies if m['type'] == 'TV Show'])
-        
-        all_genres = []
-        for movie in self.movies:
-            genres = [g.strip() for g in movie['listed_in'].split(',')]
-            all_genres.extend(genres)
-        
-        unique_genres = len(set(all_genres))
-        
-        return {
-            'total_titles': total,
-            'movies': movies,
-            'tv_shows': tv_shows,
-            'unique_genres': unique_genres
-        }
+        """Get basic statistics (computed once at load time)"""
+        return dict(self._stats)
 
 def demo():
     """Run a simple demo of the recommendation bot"""
@@ -255,39 +463,43 @@ def demo():
     
     bot = SimpleNetflixBot()
     
+    # Collect the demo output and write it in a single call
+    out = []
+    
     # Show stats
     stats = bot.get_stats()
-    print(f"\n📊 Dataset: {stats['total_titles']} titles ({stats['movies']} movies, {stats['tv_shows']} TV shows)")
-    print(f"Genres: {stats['unique_genres']}")
+    out.append(f"\n📊 Dataset: {stats['total_titles']} titles ({stats['movies']} movies, {stats['tv_shows']} TV shows)\n"
+               f"Genres: {stats['unique_genres']}")
     
     # Demo recommendations
-    print(f"\n🎯 Recommendations based on 'Stranger Things':")
+    out.append(f"\n🎯 Recommendations based on 'Stranger Things':")
     recs = bot.get_recommendations('Stranger Things', 3)
     if isinstance(recs, list):
         for i, rec in enumerate(recs, 1):
-            print(f"{i}. {rec['title']} ({rec['type']}, {rec['year']}) - Score: {rec['similarity_score']}")
+            out.append(f"{i}. {rec['title']} ({rec['type']}, {rec['year']}) - Score: {rec['similarity_score']}")
     else:
-        print(recs)
+        out.append(recs)
     
     # Demo genre search
-    print(f"\n🎭 Comedy titles:")
+    out.append(f"\n🎭 Comedy titles:")
     comedies = bot.get_by_genre('Comedy', 'all', 3)
     for i, movie in enumerate(comedies, 1):
-        print(f"{i}. {movie['title']} ({movie['type']}, {movie['year']})")
+        out.append(f"{i}. {movie['title']} ({movie['type']}, {movie['year']})")
     
     # Demo search
-    print(f"\n🔍 Search results for 'sci-fi':")
+    out.append(f"\n🔍 Search results for 'sci-fi':")
     search_results = bot.search('sci-fi', 3)
     for i, result in enumerate(search_results, 1):
-        print(f"{i}. {result['title']} ({result['type']}, {result['year']})")
+        out.append(f"{i}. {result['title']} ({result['type']}, {result['year']})")
     
     # Demo description-based search
-    print(f"\n📖 Search results for description 'dreams':")
+    out.append(f"\n📖 Search results for description 'dreams':")
     desc_results = bot.get_by_description('dreams', 'all', 3)
     for i, result in enumerate(desc_results, 1):
-        print(f"{i}. {result['title']} ({result['type']}, {result['year']}) - Matches: {result['match_score']}")
+        out.append(f"{i}. {result['title']} ({result['type']}, {result['year']}) - Matches: {result['match_score']}")
     
-    print("Demo completed! For the full experience, install the required packages and run:")
+    out.append("Demo completed! For the full experience, install the required packages and run:")
+    print("\n".join(out))
    
 if __name__ == "__main__":
     demo()
@@ -1,7 +1,4 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from recommendation_engine import NetflixRecommendationBot
 from data_downloader import download_netflix_dataset
 import os
@@ -42,14 +39,14 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@st.cache_resource
 def load_recommendation_bot():
-    """Load the recommendation bot with caching"""
+    """Load the recommendation bot once and share it across reruns and sessions"""
     # Check if dataset exists locally
     if not os.path.exists("netflix_titles.csv"):
         with st.spinner("Downloading Netflix dataset... This may take a few minutes."):
-            df, local_path = download_netflix_dataset()
-            if df is None:
+            _, local_path = download_netflix_dataset()
+            if local_path is None:
                 st.error("Failed to download dataset. Please check your internet connection.")
                 return None
     
@@ -57,6 +54,29 @@ def load_recommendation_bot():
         bot = NetflixRecommendationBot()
         return bot
 
+# Query results are cached per input; the bot argument is underscored so
+# Streamlit does not try to hash it
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def get_content_recommendations(_bot, title, n_recommendations):
+    """Cached content-based recommendations"""
+    return _bot.get_content_recommendations(title, n_recommendations)
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def get_recommendations_by_genre(_bot, genre, content_type, n_recommendations):
+    """Cached genre-based recommendations"""
+    return _bot.get_recommendations_by_genre(genre, content_type, n_recommendations)
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def get_recommendations_by_description(_bot, description, content_type, n_recommendations):
+    """Cached description-based recommendations"""
+    return _bot.get_recommendations_by_description(description, content_type, n_recommendations)
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def search_titles(_bot, query, n_results):
+    """Cached title search"""
+    return _bot.search_titles(query, n_results)
+
 def display_recommendations(recommendations, title="Recommendations"):
     """Display recommendations in a nice format"""
     st.markdown(f"<h3 class='sub-header'>{title}</h3>", unsafe_allow_html=True)
@@ -69,17 +89,23 @@ def display_recommendations(recommendations, title="Recommendations"):
         st.info("No recommendations found.")
         return
     
-    for idx, row in recommendations.iterrows():
-        with st.container():
-            st.markdown(f"""
+    cards = []
+    for row in recommendations.itertuples(index=False):
+        description = str(row.description)
+        if len(description) > 200:
+            description = description[:200] + "..."
+        cards.append(f"""
             <div class="recommendation-card">
-                <h4>{row['title']} ({row['type']})</h4>
-                <p><strong>Release Year:</strong> {row['release_year']}</p>
-                <p><strong>Rating:</strong> {row['rating']}</p>
-                <p><strong>Genres:</strong> {row['listed_in']}</p>
-                <p><strong>Description:</strong> {row['description'][:200]}{'...' if len(str(row['description'])) > 200 else ''}</p>
+                <h4>{row.title} ({row.type})</h4>
+                <p><strong>Release Year:</strong> {row.release_year}</p>
+                <p><strong>Rating:</strong> {row.rating}</p>
+                <p><strong>Genres:</strong> {row.listed_in}</p>
+                <p><strong>Description:</strong> {description}</p>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+    
+    # Render all cards with a single markdown call
+    st.markdown("".join(cards), unsafe_allow_html=True)
 
 def main():
     # Main header
@@ -122,7 +148,7 @@ def main():
         
         if st.button("Get Content Recommendations", type="primary"):
             if title_input:
-                recommendations = bot.get_content_recommendations(title_input, num_recs)
+                recommendations = get_content_recommendations(bot, title_input, num_recs)
                 display_recommendations(recommendations, f"Movies/Shows similar to '{title_input}'")
             else:
                 st.warning("Please enter a title.")
@@ -144,7 +170,7 @@ def main():
             num_genre_recs = st.selectbox("Number of results:", [5, 10, 15, 20], index=1, key="genre_num")
         
         if st.button("Get Genre Recommendations", type="primary"):
-            recommendations = bot.get_recommendations_by_genre(genre_input, content_type.lower(), num_genre_recs)
+            recommendations = get_recommendations_by_genre(bot, genre_input, content_type.lower(), num_genre_recs)
             display_recommendations(recommendations, f"Top {content_type} in {genre_input}")
     
     with tab3:
@@ -165,7 +191,7 @@ def main():
         
         if st.button("Get Description-Based Recommendations", type="primary"):
             if description_input.strip():
-                recommendations = bot.get_recommendations_by_description(description_input, desc_content_type.lower(), num_desc_recs)
+                recommendations = get_recommendations_by_description(bot, description_input, desc_content_type.lower(), num_desc_recs)
                 display_recommendations(recommendations, f"Recommendations for '{description_input[:50]}...'")
             else:
                 st.warning("Please enter a description of what you'd like to watch.")
@@ -182,7 +208,7 @@ def main():
         
         if st.button("Search", type="primary"):
             if search_query:
-                results = bot.search_titles(search_query, num_search)
+                results = search_titles(bot, search_query, num_search)
                 display_recommendations(results, f"Search results for '{search_query}'")
             else:
                 st.warning("Please enter a search query.")
@@ -2,8 +2,10 @@
 Simple test script to verify the Netflix Recommendation Bot setup
 """
 
+from importlib.util import find_spec
+
 def test_imports():
-    """Test if all required packages can be imported"""
+    """Test if all required packages are installed (without importing them)"""
     required_packages = [
         'kagglehub',
         'pandas', 
@@ -11,7 +13,6 @@ def test_imports():
         'sklearn',
         'matplotlib',
         'seaborn',
-        'nltk',
         'wordcloud',
         'streamlit',
         'plotly'
@@ -21,15 +22,14 @@ def test_imports():
     print("=" * 40)
     
     for package in required_packages:
-        try:
-            __import__(package)
+        if find_spec(package) is not None:
             print(f"✅ {package}")
-        except ImportError as e:
-            print(f"❌ {package} - {e}")
+        else:
+            print(f"❌ {package} - not installed")
     
     print("\n" + "=" * 40)
     print("If any packages are missing, install them with:")
-    print("pip install kagglehub pandas numpy scikit-learn matplotlib seaborn nltk wordcloud streamlit plotly")
+    print("pip install kagglehub pandas numpy scikit-learn matplotlib seaborn wordcloud streamlit plotly")
 
 def test_basic_functionality():
     """Test basic functionality without downloading dataset"""